@@ -1,7 +1,11 @@
 import pytest
 import pandas as pd
 import os
-from src.kwanza_tukule_analysis import KwanzaTukuleAnalysis
+import logging
+from src.kwanza_tukule_analysis import KwanzaTukuleAnalysis, TOTALS_KEYS
+
+# Skip formatting and writing the analysis progress logs during tests
+logging.getLogger('src.kwanza_tukule_analysis').setLevel(logging.WARNING)
 
 """
 Test suite for the KwanzaTukuleAnalysis class.
@@ -11,21 +15,37 @@ including data loading, cleaning, and analysis operations.
 
 Test Cases:
     - test_load_data: Validates dataset loading functionality 
+    - test_load_data_cold_cache: Validates parsing the workbook and writing the cache when there is none
+    - test_load_data_from_cache: Validates loading from the Parquet cache
+    - test_load_data_corrupt_cache: Validates falling back to the workbook when the cache is unreadable
     - test_clean_data: Validates data cleaning operations
     - test_feature_engineering: Validates feature engineering functionality
     - test_sales_overview: Validates sales analysis functionality
+    - test_bincount_totals: Validates the bincount totals against a pandas groupby
+    - test_bincount_totals_skip_leading_nan: Validates that missing prices are skipped in the totals
     - test_trends_over_time: Validates trend analysis functionality
+    - test_precompute_totals: Validates the concurrently computed totals
     - test_customer_segmentation: Validates customer segmentation
+    - test_unknown_engine: Validates that unsupported engines are rejected
+    - test_engine: Validates each optional engine's totals and segmentation match the default
+    - test_engine_skip_leading_nan: Validates that each optional engine skips missing values
     - test_create_dashboard: Validates dashboard creation
 """
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(BASE_DIR, 'data', 'case_study_data.xlsx')
+SHEET_NAME = 'case_study_data_2025-01-16T06_4'
+
+@pytest.fixture(scope='session')
+def cache_path(tmp_path_factory):
+    """Parquet cache shared by the session, outside the repo, so the workbook is parsed once"""
+    return str(tmp_path_factory.mktemp('cache') / 'case_study_data.parquet')
+
 @pytest.fixture
-def analysis():
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  
-    DATA_DIR = os.path.join(BASE_DIR, 'data')
+def analysis(tmp_path, cache_path):
     """Fixture to create analysis instance for tests"""
-    return KwanzaTukuleAnalysis(file_path=os.path.join(DATA_DIR, 'case_study_data.xlsx'),
-                               sheet_name='case_study_data_2025-01-16T06_4')
+    return KwanzaTukuleAnalysis(file_path=DATA_FILE, sheet_name=SHEET_NAME,
+                                plots_dir=str(tmp_path / 'plots'), cache_path=cache_path)
 
 def test_load_data(analysis):
     """Test case to validate the dataset load functionality."""
@@ -34,6 +54,34 @@ def test_load_data(analysis):
     assert len(analysis.data) > 0, "Dataset is empty!"
     assert isinstance(analysis.data, pd.DataFrame), "Data not loaded as DataFrame!"
 
+def test_load_data_cold_cache(analysis, tmp_path):
+    """Test case to validate that a load without a cache parses the workbook and writes the cache."""
+    cold = KwanzaTukuleAnalysis(DATA_FILE, SHEET_NAME, cache_path=str(tmp_path / 'cold.parquet'))
+    assert not cold._cache_is_fresh(), "Cache unexpectedly present!"
+    cold.load_data()
+    assert os.path.exists(cold.cache_path), "Parquet cache was not written!"
+    pd.testing.assert_frame_equal(cold.data, analysis.load_data())
+
+def test_load_data_from_cache(analysis):
+    """Test case to validate that a second load reads the Parquet cache."""
+    analysis.load_data()
+    assert os.path.exists(analysis.cache_path), "Parquet cache was not written!"
+    assert analysis._cache_is_fresh(), "Parquet cache is stale!"
+    cached = KwanzaTukuleAnalysis(analysis.file_path, analysis.sheet_name, cache_path=analysis.cache_path).load_data()
+    pd.testing.assert_frame_equal(cached, analysis.data)
+
+def test_load_data_corrupt_cache(tmp_path):
+    """Test case to validate that an unreadable cache falls back to the workbook and is rewritten."""
+    expected = pd.DataFrame({'DATE': pd.to_datetime(['2024-01-01', '2024-01-02']), 'QUANTITY': [1, 2]})
+    workbook = str(tmp_path / 'data.xlsx')
+    expected.to_excel(workbook, sheet_name='data', index=False)
+    corrupt = KwanzaTukuleAnalysis(workbook, 'data', cache_path=str(tmp_path / 'data.parquet'))
+    with open(corrupt.cache_path, 'wb') as f:
+        f.write(b'not parquet')
+    assert corrupt._cache_is_fresh(), "Corrupt cache not considered fresh!"
+    pd.testing.assert_frame_equal(corrupt.load_data(), expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(corrupt.cache_path), expected)
+
 def test_clean_data(analysis):
     """Test case to validate the data cleaning functionality."""
     analysis.load_data()
@@ -41,6 +89,9 @@ def test_clean_data(analysis):
     assert analysis.cleaned_data is not None, "Data is not cleaned!"
     assert analysis.cleaned_data.duplicated().sum() == 0, "Duplicates were not removed!"
     assert not analysis.cleaned_data.isnull().any().any(), "Missing values still present!"
+    assert analysis.cleaned_data['ANONYMIZED CATEGORY'].dtype == 'category', "Category not stored as categorical!"
+    assert analysis.cleaned_data['ANONYMIZED BUSINESS'].dtype == 'category', "Business not stored as categorical!"
+    assert analysis.cleaned_data['QUANTITY'].dtype.itemsize < 8, "QUANTITY not downcast!"
 
 def test_feature_engineering(analysis):
     """Test case to validate feature engineering."""
@@ -49,6 +100,7 @@ def test_feature_engineering(analysis):
     analysis.feature_engineering()
     assert 'Month-Year' in analysis.cleaned_data.columns, "Month-Year column not created!"
     assert analysis.cleaned_data['DATE'].dtype == 'datetime64[ns]', "DATE not converted to datetime!"
+    assert analysis.cleaned_data['DATE'].is_monotonic_increasing, "Data not sorted by DATE!"
 
 def test_sales_overview(analysis):
     """Test case to validate sales analysis."""
@@ -59,6 +111,30 @@ def test_sales_overview(analysis):
     assert isinstance(business_sales, pd.DataFrame), "Business sales not returned as DataFrame!"
     assert 'QUANTITY' in category_sales.columns, "QUANTITY missing from category sales!"
     assert 'UNIT PRICE' in business_sales.columns, "UNIT PRICE missing from business sales!"
+    assert os.path.exists(os.path.join(analysis.plots_dir, 'total_value_by_category.png')), "Chart not saved!"
+
+def test_bincount_totals(analysis):
+    """Test case to validate that the bincount totals match a pandas groupby."""
+    analysis.load_data()
+    analysis.clean_data()
+    for key in ['ANONYMIZED CATEGORY', 'ANONYMIZED BUSINESS']:
+        expected = analysis.cleaned_data.groupby(key, observed=True)[['QUANTITY', 'UNIT PRICE']].sum()
+        pd.testing.assert_frame_equal(analysis._totals(key), expected, check_dtype=False)
+
+def test_bincount_totals_skip_leading_nan(analysis):
+    """Test case to validate that a leading NaN price, which ffill cannot fill, is skipped."""
+    analysis.data = pd.DataFrame({
+        'DATE': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03']),
+        'ANONYMIZED CATEGORY': ['c1', 'c1', 'c2'],
+        'ANONYMIZED BUSINESS': ['b1', 'b2', 'b1'],
+        'QUANTITY': [1, 2, 3],
+        'UNIT PRICE': [float('nan'), 5.0, 7.0],
+    })
+    analysis.clean_data()
+    for key in ['ANONYMIZED CATEGORY', 'ANONYMIZED BUSINESS']:
+        expected = analysis.cleaned_data.groupby(key, observed=True)[['QUANTITY', 'UNIT PRICE']].sum()
+        pd.testing.assert_frame_equal(analysis._totals(key), expected, check_dtype=False)
+    assert analysis._totals('ANONYMIZED CATEGORY').loc['c1', 'UNIT PRICE'] == 5.0, "NaN price not skipped!"
 
 def test_trends_over_time(analysis):
     """Test case to validate trend analysis."""
@@ -70,6 +146,18 @@ def test_trends_over_time(analysis):
     assert 'Month-Year' in monthly_data.columns, "Month-Year column missing!"
     assert len(monthly_data) > 0, "No trends data generated!"
 
+def test_precompute_totals(analysis):
+    """Test case to validate that totals computed in worker threads match sequential ones."""
+    analysis.load_data()
+    analysis.clean_data()
+    analysis.feature_engineering()
+    analysis._precompute_totals()
+    precomputed = dict(analysis._totals_cache)
+    assert set(precomputed) == {'ANONYMIZED CATEGORY', 'ANONYMIZED BUSINESS', 'Month-Year'}, "Totals not precomputed!"
+    analysis._reset_groupby_cache()
+    for key, totals in precomputed.items():
+        pd.testing.assert_frame_equal(totals, analysis._totals(key))
+
 def test_customer_segmentation(analysis):
     """Test case to validate customer segmentation."""
     analysis.load_data()
@@ -79,6 +167,55 @@ def test_customer_segmentation(analysis):
     assert 'Segment' in segmentation.columns, "Segment column missing!"
     assert set(segmentation['Segment'].unique()) == {'Low Value', 'Medium Value', 'High Value'}, "Invalid segments!"
 
+def test_unknown_engine():
+    """Test case to validate that a misspelled engine is rejected instead of silently ignored."""
+    with pytest.raises(ValueError, match="Unknown engine 'numab'"):
+        KwanzaTukuleAnalysis(DATA_FILE, SHEET_NAME, engine='numab')
+
+ENGINES = [
+    ('numba', 'numba'),
+    ('polars', 'polars'),
+    ('dask', 'dask.dataframe'),
+]
+
+def engine_analysis(analysis, engine, module, data):
+    """Prepare the same raw data on the default instance and a new one on the given engine."""
+    pytest.importorskip(module)
+    other = KwanzaTukuleAnalysis(analysis.file_path, analysis.sheet_name, engine=engine)
+    for instance in [analysis, other]:
+        instance.data = data
+        instance.clean_data()
+        instance.feature_engineering()
+    return other
+
+@pytest.mark.parametrize('engine, module', ENGINES)
+def test_engine(analysis, engine, module):
+    """Test case to validate that an optional engine produces the same totals and segmentation."""
+    analysis.load_data()
+    other = engine_analysis(analysis, engine, module, analysis.data)
+    other._precompute_totals()
+    assert set(other._totals_cache) == set(TOTALS_KEYS), "Totals not precomputed!"
+    for key in TOTALS_KEYS:
+        # pandas narrows integer sums back to the downcast QUANTITY dtype when they fit
+        pd.testing.assert_frame_equal(other._totals(key), analysis._totals(key), check_dtype=False)
+    pd.testing.assert_frame_equal(other.customer_segmentation(),
+                                  analysis.customer_segmentation(), check_dtype=False)
+
+@pytest.mark.parametrize('engine, module', ENGINES)
+def test_engine_skip_leading_nan(analysis, engine, module):
+    """Test case to validate that an optional engine skips leading NaNs, which ffill cannot fill."""
+    other = engine_analysis(analysis, engine, module, pd.DataFrame({
+        'DATE': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']),
+        'ANONYMIZED CATEGORY': ['c1', 'c1', 'c2', 'c2'],
+        'ANONYMIZED BUSINESS': ['b1', 'b2', 'b1', 'b3'],
+        'QUANTITY': [float('nan'), 2, 3, 4],
+        'UNIT PRICE': [float('nan'), 5.0, 7.0, 1.0],
+    }))
+    for key in ['ANONYMIZED CATEGORY', 'ANONYMIZED BUSINESS']:
+        pd.testing.assert_frame_equal(other._totals(key), analysis._totals(key), check_dtype=False)
+    segmentation = other.customer_segmentation()
+    pd.testing.assert_frame_equal(segmentation, analysis.customer_segmentation(), check_dtype=False)
+    assert segmentation.loc[0, 'Total_Value'] == 7.0, "NaN price not skipped!"
 
 def test_create_dashboard(analysis):
     """Test case to validate dashboard creation."""